@@ -1,23 +1,35 @@
+import asyncio
 import logging
+import math
 import os
 from datetime import datetime, time as datetime_time, timedelta
-import threading
 import time
-from typing import Dict, List, Set, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import aiohttp
+from aiolimiter import AsyncLimiter
+import xxhash
 import yfinance as yf
 import pandas as pd
 import ccxt
-import ta
 from telegram import Update
+from telegram.error import RetryAfter
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
-import feedparser
-import schedule
+try:
+    # Rust-backed replacement with the same parse() API (see _entry_article)
+    import feedparser_rs as feedparser
+    _FEEDPARSER_RS = True
+except ImportError:
+    import feedparser
+    _FEEDPARSER_RS = False
 from dotenv import load_dotenv
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
-import requests
-from bs4 import BeautifulSoup
+from nltk.sentiment.vader import SentiText
+from bs4 import BeautifulSoup, UnicodeDammit
+from selectolax.lexbor import LexborHTMLParser
 import re
+from html import unescape
 
 # Download required NLTK data
 nltk.download('vader_lexicon')
@@ -49,8 +61,55 @@ WEBHOOK_URL_PATH = f"/{token}"
 # Dictionary to store user preferences
 user_preferences: Dict[int, Dict] = {}
 
-# Set to track sent articles
-sent_articles: Set[str] = set()
+# LRU of hashed (user, article URL) keys to track sent articles
+SENT_ARTICLES_MAX = 50000
+sent_articles: "OrderedDict[int, None]" = OrderedDict()
+
+# Conditional GET cache for RSS feeds: url -> (etag, last_modified, parsed feed)
+feed_cache: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+
+# Price data cache: (symbol, hours) -> (fetched_at, data)
+PRICE_CACHE_TTL = 300  # seconds
+_price_cache: Dict[Tuple[str, int], Tuple[float, pd.DataFrame]] = {}
+
+# Shared HTTP session, created once the event loop is running (see main)
+_http: Optional[aiohttp.ClientSession] = None
+
+# Compressed encodings we can decode (br requires the Brotli package)
+_ACCEPT_ENCODING = 'gzip, deflate, br'
+
+# Browser-like headers for scraped sites that reject default clients
+_UA_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': _ACCEPT_ENCODING
+}
+
+# Upper bound on any downloaded body so a misbehaving server cannot exhaust memory
+_MAX_RESPONSE_BYTES = 1_000_000
+
+# Per-topic digest cache: topic -> (expires_at, digest)
+DIGEST_CACHE_TTL = 300  # seconds
+DIGEST_RETRY_TTL = 30  # seconds, for digests built while sources or market data were failing
+_digest_cache: Dict[str, Tuple[float, List[Tuple[str, str, str]]]] = {}
+
+# Number of users whose scheduled recaps are sent concurrently
+RECAP_CHUNK_SIZE = 30
+
+# Shared Telegram send rate limit (the Bot API allows ~30 messages per second)
+_tg_limiter = AsyncLimiter(25, 1.0)
+
+# Per-chat send pacing (Telegram allows about one message per second per chat)
+_chat_limiters: Dict[int, AsyncLimiter] = {}
+
+# Maximum length of a fallback article summary
+_SUMMARY_TRUNC = 200
+
+# Meta description tag, scanned for in the first bytes of an article
+_SUMMARY_SCAN_BYTES = 32768
+_META_DESC = re.compile(rb'<meta\s[^>]*?name=["\']description["\'][^>]*?content=(["\'])(.*?)\1', re.IGNORECASE)
+
+# Messages that trigger the floompnews greeting
+_FLOOMPNEWS_PATTERN = re.compile(r'floompnews', re.IGNORECASE)
 
 # News sources with categories
 NEWS_SOURCES = {
@@ -108,6 +167,47 @@ CRYPTO_SYMBOLS = {
 # Initialize sentiment analyzer
 sia = SentimentIntensityAnalyzer()
 
+# Flat VADER lexicon for the fast sentiment path
+_LEX: Dict[str, float] = sia.lexicon
+
+# Words that trigger VADER's negation, booster, "kind of", "least", "never so/this" and "but" rules
+_VADER_MODIFIERS = (
+    set(sia.constants.NEGATE)
+    | {word for word in sia.constants.BOOSTER_DICT if " " not in word}
+    | {"but", "kind", "least", "never", "so", "this"}
+)
+
+# Multi-word idioms and boosters VADER matches across neighbouring tokens
+_VADER_PHRASES = tuple(
+    f" {phrase} " for phrase in list(sia.constants.SPECIAL_CASE_IDIOMS) + list(sia.constants.BOOSTER_DICT)
+    if " " in phrase
+)
+
+# Compound score thresholds used for emojis and market impact, and how close a
+# fast estimate may come to one before full VADER is run instead
+_SENTIMENT_THRESHOLDS = (-0.2, -0.05, 0.05, 0.2)
+_SENTIMENT_MARGIN = 0.05
+
+def _article_key(user_id: int, url: str) -> int:
+    """Hash an article URL into a compact per-user key."""
+    return xxhash.xxh64_intdigest(f"{user_id}:{url}".encode())
+
+def _seen(user_id: int, url: str) -> bool:
+    """Check whether an article was already sent to the user."""
+    key = _article_key(user_id, url)
+    if key in sent_articles:
+        sent_articles.move_to_end(key)
+        return True
+    return False
+
+def _mark(user_id: int, url: str) -> None:
+    """Remember that an article was sent, evicting the oldest entries past the limit."""
+    key = _article_key(user_id, url)
+    sent_articles[key] = None
+    sent_articles.move_to_end(key)
+    if len(sent_articles) > SENT_ARTICLES_MAX:
+        sent_articles.popitem(last=False)
+
 def get_sentiment_emoji(compound_score: float) -> str:
     """Return an emoji based on sentiment score."""
     if compound_score >= 0.05:
@@ -117,15 +217,82 @@ def get_sentiment_emoji(compound_score: float) -> str:
     else:
         return "➡️"  # Neutral
 
-def analyze_sentiment(text: str) -> Dict[str, float]:
-    """Analyze sentiment of text using NLTK's VADER."""
-    return sia.polarity_scores(text)
+def fast_compound(text: str) -> Optional[float]:
+    """Compute VADER's compound score as a plain lexicon sum, or None if any of VADER's other rules would apply."""
+    # Punctuation emphasis is only handled by full VADER
+    if "!" in text or "?" in text:
+        return None
+    
+    # Tokenize exactly as VADER does (whitespace split, one edge punctuation mark stripped)
+    sentitext = SentiText(text, sia.constants.PUNC_LIST, sia.constants.REGEX_REMOVE_PUNCTUATION)
+    tokens = sentitext.words_and_emoticons
+    lowered = [token.lower() for token in tokens]
+    
+    if any(token in _VADER_MODIFIERS or "n't" in token for token in lowered):
+        return None
+    joined = f" {' '.join(lowered)} "
+    if any(phrase in joined for phrase in _VADER_PHRASES):
+        return None
+    
+    score = 0.0
+    for token, word in zip(tokens, lowered):
+        value = _LEX.get(word)
+        if value is not None:
+            # ALL-CAPS emphasis changes the word's weight
+            if token.isupper() and sentitext.is_cap_diff:
+                return None
+            score += value
+    return score / math.sqrt(score * score + 15) if score else 0.0
+
+def analyze_sentiment(text: str) -> float:
+    """Analyze sentiment of text, using NLTK's VADER when the fast estimate is borderline."""
+    compound = fast_compound(text) if _FAST_SENTIMENT else None
+    if compound is not None and all(abs(compound - t) >= _SENTIMENT_MARGIN for t in _SENTIMENT_THRESHOLDS):
+        return compound
+    return sia.polarity_scores(text)['compound']
+
+# Headlines covering VADER's tokenization and rule edge cases, checked at startup
+_SENTIMENT_SAMPLES = (
+    "Bitcoin hits new all-time high :)",
+    "\"Great\" week for Bitcoin as ETF inflows surge",
+    "Bitcoin (good) news for long-term holders",
+    "Ethereum well-known developer leaves the foundation",
+    "Regulators kind of approve the new stablecoin rules",
+    "Market kiss of death for altcoins",
+    "SEC approves spot ETF, a HUGE win for crypto",
+    "Exchange hacked; users fear losses, regulators worried.",
+    "DeFi protocol launches safer lending pools",
+    "Café news: NFT sales flat this week",
+    "Bitcoin price crash wipes out leveraged traders",
+)
 
-def get_article_summary(url: str) -> str:
+def _fast_compound_agrees() -> bool:
+    """Check that the fast path matches full VADER on the sample headlines."""
+    for text in _SENTIMENT_SAMPLES:
+        compound = fast_compound(text)
+        if compound is not None and abs(compound - sia.polarity_scores(text)['compound']) > 1e-3:
+            logger.warning(f"Fast sentiment disagrees with VADER on {text!r}, using full VADER only")
+            return False
+    return True
+
+_FAST_SENTIMENT = _fast_compound_agrees()
+
+async def get_article_summary(url: str) -> str:
     """Extract a summary from the article URL."""
     try:
-        response = requests.get(url, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        async with _http.get(url, headers=_UA_HEADERS, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            response.raise_for_status()
+            
+            # Try to find meta description near the top without building a DOM
+            head = await _read_limited(response, _SUMMARY_SCAN_BYTES)
+            
+            match = _META_DESC.search(head)
+            if match and match.group(2):
+                return unescape(match.group(2).decode(response.charset or 'utf-8', 'replace'))
+            
+            page = head + await _read_limited(response, _MAX_RESPONSE_BYTES - len(head))
+        
+        soup = BeautifulSoup(page, 'lxml')
         
         # Try to find meta description
         meta_desc = soup.find('meta', {'name': 'description'})
@@ -135,7 +302,7 @@ def get_article_summary(url: str) -> str:
         # Fallback to first paragraph
         first_p = soup.find('p')
         if first_p:
-            return first_p.text[:200] + "..."
+            return first_p.text[:_SUMMARY_TRUNC] + "..."
         
         return "No summary available"
     except Exception as e:
@@ -144,96 +311,189 @@ def get_article_summary(url: str) -> str:
 
 def get_crypto_price_data(symbol: str, hours: int = 24) -> pd.DataFrame:
     """Get cryptocurrency price data for analysis."""
+    key = (symbol, hours)
+    cached = _price_cache.get(key)
+    if cached and time.monotonic() - cached[0] < PRICE_CACHE_TTL:
+        return cached[1]
+    
     try:
         # Get data from yfinance
         ticker = yf.Ticker(symbol)
         data = ticker.history(period=f"{hours}h", interval="1h")
         
-        # Calculate technical indicators
-        data['RSI'] = ta.momentum.RSIIndicator(data['Close']).rsi()
-        data['MACD'] = ta.trend.MACD(data['Close']).macd()
-        data['BB_upper'], data['BB_middle'], data['BB_lower'] = ta.volatility.BollingerBands(data['Close']).bollinger_bands()
-        
+        # Calculate technical indicators with pandas' vectorized EWM/rolling aggregators
+        close = data['Close']
+        
+        # RSI (14) with Wilder smoothing
+        delta = close.diff()
+        up = delta.clip(lower=0).fillna(0).ewm(alpha=1/14, min_periods=14, adjust=False).mean()
+        down = (-delta.clip(upper=0)).fillna(0).ewm(alpha=1/14, min_periods=14, adjust=False).mean()
+        data['RSI'] = (100 - 100 / (1 + up / down)).where(down != 0, 100.0)
+        
+        # MACD (12, 26)
+        ema_fast = close.ewm(span=12, min_periods=12, adjust=False).mean()
+        ema_slow = close.ewm(span=26, min_periods=26, adjust=False).mean()
+        data['MACD'] = ema_fast - ema_slow
+        
+        # Bollinger Bands (20, 2)
+        rolling = close.rolling(20, min_periods=20)
+        middle = rolling.mean()
+        std = rolling.std(ddof=0)
+        data['BB_upper'] = middle + 2 * std
+        data['BB_middle'] = middle
+        data['BB_lower'] = middle - 2 * std
+        
+        _price_cache[key] = (time.monotonic(), data)
         return data
     except Exception as e:
         logger.error(f"Error fetching price data for {symbol}: {e}")
         return pd.DataFrame()
 
-def analyze_market_impact(symbol: str, sentiment_score: float) -> str:
-    """Analyze potential market impact based on news sentiment."""
+def _compute_market_state(data: pd.DataFrame) -> Dict[str, Any]:
+    """Extract the price change and indicator readings used for impact analysis."""
+    # Get current price and recent changes
+    current_price = data['Close'].iloc[-1]
+    price_24h_ago = data['Close'].iloc[0]
+    price_change = ((current_price - price_24h_ago) / price_24h_ago) * 100
+    
+    # Get technical indicators
+    rsi = data['RSI'].iloc[-1]
+    macd = data['MACD'].iloc[-1]
+    
+    # Analyze market conditions
+    market_condition = "neutral"
+    if rsi > 70:
+        market_condition = "overbought"
+    elif rsi < 30:
+        market_condition = "oversold"
+    
+    return {
+        "price_change": float(price_change),
+        "macd": float(macd),
+        "condition": market_condition
+    }
+
+def _format_impact(state: Dict[str, Any], sentiment_score: float) -> str:
+    """Combine a market state with an article's sentiment into an impact note."""
+    impact = []
+    if sentiment_score > 0.2 and state["condition"] == "oversold":
+        impact.append("Strong potential for price increase")
+    elif sentiment_score < -0.2 and state["condition"] == "overbought":
+        impact.append("High risk of price correction")
+    
+    if abs(state["price_change"]) > 5:
+        impact.append(f"Significant price movement ({state['price_change']:.2f}%) in last 24h")
+    
+    if state["macd"] > 0:
+        impact.append("MACD indicates bullish momentum")
+    elif state["macd"] < 0:
+        impact.append("MACD indicates bearish momentum")
+    
+    return "\n".join(impact) if impact else "Market impact unclear"
+
+def get_market_state(symbol: str) -> Optional[Dict[str, Any]]:
+    """Fetch price data for a symbol and summarize its current market state."""
     try:
         data = get_crypto_price_data(symbol)
         if data.empty:
-            return "Market data unavailable"
-        
-        # Get current price and recent changes
-        current_price = data['Close'].iloc[-1]
-        price_24h_ago = data['Close'].iloc[0]
-        price_change = ((current_price - price_24h_ago) / price_24h_ago) * 100
-        
-        # Get technical indicators
-        rsi = data['RSI'].iloc[-1]
-        macd = data['MACD'].iloc[-1]
-        
-        # Analyze market conditions
-        market_condition = "neutral"
-        if rsi > 70:
-            market_condition = "overbought"
-        elif rsi < 30:
-            market_condition = "oversold"
-        
-        # Generate impact prediction
-        impact = []
-        if sentiment_score > 0.2 and market_condition == "oversold":
-            impact.append("Strong potential for price increase")
-        elif sentiment_score < -0.2 and market_condition == "overbought":
-            impact.append("High risk of price correction")
-        
-        if abs(price_change) > 5:
-            impact.append(f"Significant price movement ({price_change:.2f}%) in last 24h")
-        
-        if macd > 0:
-            impact.append("MACD indicates bullish momentum")
-        elif macd < 0:
-            impact.append("MACD indicates bearish momentum")
-        
-        return "\n".join(impact) if impact else "Market impact unclear"
+            return None
+        return _compute_market_state(data)
     except Exception as e:
         logger.error(f"Error analyzing market impact: {e}")
-        return "Error analyzing market impact"
-
-def scrape_theblock(topic: str) -> List[Tuple[str, str, str]]:
+        return None
+
+async def _fetch_html(session: aiohttp.ClientSession, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+    """Download an HTML page and decode it using the HTTP or in-document charset."""
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        response.raise_for_status()
+        body = await _read_capped(response)
+        charset = response.charset
+    
+    # selectolax only decodes UTF-8, so let bs4's detector handle declared and legacy encodings
+    markup = UnicodeDammit(body, [charset] if charset else [], is_html=True).unicode_markup
+    return markup if markup is not None else body.decode('utf-8', 'replace')
+
+async def _read_limited(response: aiohttp.ClientResponse, limit: int) -> bytes:
+    """Read at most limit bytes of a response body."""
+    body = bytearray()
+    while len(body) < limit:
+        chunk = await response.content.read(limit - len(body))
+        if not chunk:
+            break
+        body += chunk
+    return bytes(body)
+
+async def _read_capped(response: aiohttp.ClientResponse) -> bytes:
+    """Read a response body, truncated to _MAX_RESPONSE_BYTES."""
+    body = await _read_limited(response, _MAX_RESPONSE_BYTES)
+    if not response.content.at_eof():
+        logger.warning(f"Response from {response.url} truncated to {_MAX_RESPONSE_BYTES} bytes")
+    return body
+
+async def _fetch_feed(session: aiohttp.ClientSession, url: str) -> Any:
+    """Download and parse an RSS feed, reusing the cached copy if it is unchanged."""
+    headers = {'Accept-Encoding': _ACCEPT_ENCODING}
+    cached = feed_cache.get(url)
+    if cached:
+        etag, modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+        
+        # Without an ETag, a bodiless HEAD is enough to tell whether the feed changed
+        if modified and not etag:
+            try:
+                async with session.head(url, timeout=aiohttp.ClientTimeout(total=5), allow_redirects=True) as response:
+                    if response.headers.get('Last-Modified') == modified:
+                        logger.info(f"Feed not modified, using cached copy: {url}")
+                        return cached[2]
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.debug(f"HEAD pre-check failed for feed {url}: {e}")
+    
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        if response.status == 304 and cached:
+            logger.info(f"Feed not modified, using cached copy: {url}")
+            return cached[2]
+        response.raise_for_status()
+        body = await _read_capped(response)
+        etag = response.headers.get('ETag')
+        modified = response.headers.get('Last-Modified')
+    
+    logger.info(f"Parsing feed: {url}")
+    feed = feedparser.parse(body)
+    if etag or modified:
+        feed_cache[url] = (etag, modified, feed)
+    return feed
+
+def _entry_article(entry: Any) -> Tuple[str, str, str]:
+    """Normalize a feed entry to (title, summary, link) across feedparser backends."""
+    title = getattr(entry, 'title', None) or ""
+    summary = getattr(entry, 'summary', None) or ""
+    if _FEEDPARSER_RS:
+        # feedparser-rs leaves HTML entities in text fields, feedparser decodes them
+        title, summary = unescape(title), unescape(summary)
+    return title, summary, getattr(entry, 'link', None) or ""
+
+async def scrape_theblock(topic: str) -> List[Tuple[str, str, str]]:
     """Scrape news from The Block."""
     try:
-        # Map topics to The Block's URL structure
-        topic_mapping = {
-            "bitcoin": "bitcoin",
-            "ethereum": "ethereum",
-            "defi": "defi",
-            "nft": "nft",
-            "regulation": "regulation",
-            "markets": "markets",
-            "technology": "technology"
-        }
-        
-        mapped_topic = topic_mapping.get(topic, topic)
-        url = f"https://www.theblock.co/topic/{mapped_topic}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        url = f"https://www.theblock.co/topic/{topic}"
+        html = await _fetch_html(_http, url, _UA_HEADERS)
+        tree = LexborHTMLParser(html)
         
         articles = []
-        for article in soup.select('article.article-card'):
-            title_elem = article.select_one('h3.article-card__title')
-            link_elem = article.select_one('a.article-card__link')
-            summary_elem = article.select_one('p.article-card__description')
+        for article in tree.css('article.article-card'):
+            title_elem = article.css_first('h3.article-card__title')
+            link_elem = article.css_first('a.article-card__link')
+            summary_elem = article.css_first('p.article-card__description')
+            
+            href = (link_elem.attributes.get('href') or '') if link_elem is not None else ''
             
-            if title_elem and link_elem:
-                title = title_elem.text.strip()
-                link = "https://www.theblock.co" + link_elem['href']
-                summary = summary_elem.text.strip() if summary_elem else ""
+            if title_elem is not None and href:
+                title = title_elem.text().strip()
+                link = "https://www.theblock.co" + href
+                summary = summary_elem.text().strip() if summary_elem is not None else ""
                 articles.append((title, summary, link))
         
         return articles[:10]  # Return top 10 articles instead of 5
@@ -241,26 +501,25 @@ def scrape_theblock(topic: str) -> List[Tuple[str, str, str]]:
         logger.error(f"Error scraping The Block: {e}", exc_info=True)
         return []
 
-def scrape_decrypt(topic: str) -> List[Tuple[str, str, str]]:
+async def scrape_decrypt(topic: str) -> List[Tuple[str, str, str]]:
     """Scrape news from Decrypt."""
     try:
         url = f"https://decrypt.co/topic/{topic}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html = await _fetch_html(_http, url, _UA_HEADERS)
+        tree = LexborHTMLParser(html)
         
         articles = []
-        for article in soup.select('article.post-card'):
-            title_elem = article.select_one('h3.post-card__title')
-            link_elem = article.select_one('a.post-card__link')
-            summary_elem = article.select_one('p.post-card__excerpt')
+        for article in tree.css('article.post-card'):
+            title_elem = article.css_first('h3.post-card__title')
+            link_elem = article.css_first('a.post-card__link')
+            summary_elem = article.css_first('p.post-card__excerpt')
+            
+            href = (link_elem.attributes.get('href') or '') if link_elem is not None else ''
             
-            if title_elem and link_elem:
-                title = title_elem.text.strip()
-                link = link_elem['href']
-                summary = summary_elem.text.strip() if summary_elem else ""
+            if title_elem is not None and href:
+                title = title_elem.text().strip()
+                link = href
+                summary = summary_elem.text().strip() if summary_elem is not None else ""
                 articles.append((title, summary, link))
         
         return articles[:5]
@@ -268,26 +527,25 @@ def scrape_decrypt(topic: str) -> List[Tuple[str, str, str]]:
         logger.error(f"Error scraping Decrypt: {e}")
         return []
 
-def scrape_cryptoslate(topic: str) -> List[Tuple[str, str, str]]:
+async def scrape_cryptoslate(topic: str) -> List[Tuple[str, str, str]]:
     """Scrape news from CryptoSlate."""
     try:
         url = f"https://cryptoslate.com/category/{topic}/"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html = await _fetch_html(_http, url, _UA_HEADERS)
+        tree = LexborHTMLParser(html)
         
         articles = []
-        for article in soup.select('article.post'):
-            title_elem = article.select_one('h2.post-title')
-            link_elem = article.select_one('a.post-title-link')
-            summary_elem = article.select_one('div.post-excerpt')
+        for article in tree.css('article.post'):
+            title_elem = article.css_first('h2.post-title')
+            link_elem = article.css_first('a.post-title-link')
+            summary_elem = article.css_first('div.post-excerpt')
             
-            if title_elem and link_elem:
-                title = title_elem.text.strip()
-                link = link_elem['href']
-                summary = summary_elem.text.strip() if summary_elem else ""
+            href = (link_elem.attributes.get('href') or '') if link_elem is not None else ''
+            
+            if title_elem is not None and href:
+                title = title_elem.text().strip()
+                link = href
+                summary = summary_elem.text().strip() if summary_elem is not None else ""
                 articles.append((title, summary, link))
         
         return articles[:5]
@@ -295,52 +553,6 @@ def scrape_cryptoslate(topic: str) -> List[Tuple[str, str, str]]:
         logger.error(f"Error scraping CryptoSlate: {e}")
         return []
 
-# Topic mapping for different sources
-TOPIC_MAPPING = {
-    "bitcoin": {
-        "theblock": "bitcoin",
-        "decrypt": "bitcoin",
-        "cryptoslate": "bitcoin",
-        "unusualwhales": "bitcoin"
-    },
-    "ethereum": {
-        "theblock": "ethereum",
-        "decrypt": "ethereum",
-        "cryptoslate": "ethereum",
-        "unusualwhales": "ethereum"
-    },
-    "defi": {
-        "theblock": "defi",
-        "decrypt": "defi",
-        "cryptoslate": "defi",
-        "unusualwhales": "defi"
-    },
-    "nft": {
-        "theblock": "nft",
-        "decrypt": "nft",
-        "cryptoslate": "nft",
-        "unusualwhales": "nft"
-    },
-    "regulation": {
-        "theblock": "regulation",
-        "decrypt": "regulation",
-        "cryptoslate": "regulation",
-        "unusualwhales": "regulation"
-    },
-    "markets": {
-        "theblock": "markets",
-        "decrypt": "markets",
-        "cryptoslate": "markets",
-        "unusualwhales": "markets"
-    },
-    "technology": {
-        "theblock": "technology",
-        "decrypt": "technology",
-        "cryptoslate": "technology",
-        "unusualwhales": "technology"
-    }
-}
-
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send welcome message when the command /start is issued."""
     user_id = update.effective_user.id
@@ -380,12 +592,9 @@ async def send_daily_recap(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     logger.info(f"Sending daily recap to user {user_id}")
     
     try:
-        # Clear sent articles to ensure we get fresh news
-        sent_articles.clear()
-        
         # Fetch and send news for each topic
-        for topic in user_preferences[user_id]["topics"]:
-            await fetch_and_send_news_for_topic(context, user_id, topic)
+        digests = await build_digests(user_preferences[user_id]["topics"])
+        await send_digest_to_user(context, user_id, digests)
             
         await update.message.reply_text(
             "📰 That's all for today's recap!\n\n"
@@ -396,19 +605,71 @@ async def send_daily_recap(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         logger.error(f"Error sending daily recap: {e}", exc_info=True)
         await update.message.reply_text("Sorry, there was an error fetching the news recap. Please try again later.")
 
-async def fetch_and_send_news_for_topic(context: ContextTypes.DEFAULT_TYPE, user_id: int, topic: str) -> None:
-    """Fetch and send news for a specific topic."""
+async def send_scheduled_recaps(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Send a recap to every user subscribed to the job's frequency."""
+    frequency = context.job.data
+    users = [
+        user_id for user_id, prefs in user_preferences.items()
+        if prefs.get("frequency") == frequency and prefs.get("topics")
+    ]
+    if not users:
+        return
+    
+    logger.info(f"Sending {frequency} recap to {len(users)} users")
+    
+    # Build each topic's digest once and share it between all users
+    topics = {topic for user_id in users for topic in user_preferences[user_id]["topics"]}
+    digests = await build_digests(topics)
+    
+    for i in range(0, len(users), RECAP_CHUNK_SIZE):
+        chunk = users[i:i + RECAP_CHUNK_SIZE]
+        results = await asyncio.gather(
+            *(send_digest_to_user(context, user_id, digests) for user_id in chunk),
+            return_exceptions=True
+        )
+        for user_id, result in zip(chunk, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending {frequency} recap to user {user_id}: {result}")
+
+async def build_digests(topics: Iterable[str]) -> Dict[str, List[Tuple[str, str, str]]]:
+    """Build the digests for several topics concurrently."""
+    topics = list(topics)
+    digests = await asyncio.gather(*(build_topic_digest(topic) for topic in topics))
+    return dict(zip(topics, digests))
+
+async def build_topic_digest(topic: str) -> List[Tuple[str, str, str]]:
+    """Fetch and format the news for a topic as (title, link, message) tuples."""
+    cached = _digest_cache.get(topic)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+    
     logger.info(f"Fetching news for topic: {topic}")
     
     # Get articles from all sources
     all_articles = []
     
+    feed_urls = NEWS_SOURCES[topic]
+    scrapers = [
+        ("The Block", scrape_theblock(topic)),
+        ("Decrypt", scrape_decrypt(topic)),
+        ("CryptoSlate", scrape_cryptoslate(topic)),
+    ]
+    
+    # Fetch feeds and scrape pages concurrently
+    results = await asyncio.gather(
+        *(_fetch_feed(_http, url) for url in feed_urls),
+        *(scraper for _, scraper in scrapers),
+        return_exceptions=True
+    )
+    feeds = results[:len(feed_urls)]
+    scraped = results[len(feed_urls):]
+    
     # Get RSS feed articles
-    for source in NEWS_SOURCES[topic]:
+    for source, feed in zip(feed_urls, feeds):
+        if isinstance(feed, Exception):
+            logger.error(f"Error fetching feed {source}: {feed}")
+            continue
         try:
-            logger.info(f"Parsing feed: {source}")
-            feed = feedparser.parse(source)
-            
             if not feed.entries:
                 logger.warning(f"No entries found in feed: {source}")
                 continue
@@ -416,64 +677,52 @@ async def fetch_and_send_news_for_topic(context: ContextTypes.DEFAULT_TYPE, user
             logger.info(f"Found {len(feed.entries)} entries in feed {source}")
             
             for entry in feed.entries[:10]:
-                if entry.link not in sent_articles:
-                    all_articles.append((entry.title, entry.summary, entry.link))
-                    logger.info(f"Added article from {source}: {entry.title}")
+                title, summary, link = _entry_article(entry)
+                if not title or not link:
+                    continue
+                all_articles.append((title, summary, link))
+                logger.info(f"Added article from {source}: {title}")
         except Exception as e:
             logger.error(f"Error processing feed {source}: {e}", exc_info=True)
     
     # Get scraped articles
-    if topic in TOPIC_MAPPING:
-        topic_mapping = TOPIC_MAPPING[topic]
-        
-        # The Block articles
-        try:
-            logger.info(f"Scraping The Block for topic: {topic_mapping['theblock']}")
-            theblock_articles = scrape_theblock(topic_mapping["theblock"])
-            logger.info(f"Found {len(theblock_articles)} articles from The Block")
-            all_articles.extend(theblock_articles)
-        except Exception as e:
-            logger.error(f"Error scraping The Block: {e}", exc_info=True)
-        
-        # Decrypt articles
-        try:
-            logger.info(f"Scraping Decrypt for topic: {topic_mapping['decrypt']}")
-            decrypt_articles = scrape_decrypt(topic_mapping["decrypt"])
-            logger.info(f"Found {len(decrypt_articles)} articles from Decrypt")
-            all_articles.extend(decrypt_articles)
-        except Exception as e:
-            logger.error(f"Error scraping Decrypt: {e}", exc_info=True)
-        
-        # CryptoSlate articles
-        try:
-            logger.info(f"Scraping CryptoSlate for topic: {topic_mapping['cryptoslate']}")
-            cryptoslate_articles = scrape_cryptoslate(topic_mapping["cryptoslate"])
-            logger.info(f"Found {len(cryptoslate_articles)} articles from CryptoSlate")
-            all_articles.extend(cryptoslate_articles)
-        except Exception as e:
-            logger.error(f"Error scraping CryptoSlate: {e}", exc_info=True)
+    for (name, _), articles in zip(scrapers, scraped):
+        if isinstance(articles, Exception):
+            logger.error(f"Error scraping {name}: {articles}")
+            continue
+        logger.info(f"Found {len(articles)} articles from {name}")
+        all_articles.extend(articles)
     
     # Remove duplicates based on title
-    seen_titles = set()
-    unique_articles = []
+    uniq: Dict[int, Tuple[str, str, str]] = {}
     for title, summary, link in all_articles:
-        if title not in seen_titles and link not in sent_articles:
-            seen_titles.add(title)
-            unique_articles.append((title, summary, link))
+        key = xxhash.xxh3_64_intdigest(title.lower().encode())
+        if key not in uniq:
+            uniq[key] = (title, summary, link)
+    unique_articles = list(uniq.values())
     
     logger.info(f"Total unique articles found: {len(unique_articles)}")
     
-    # Process and send articles
-    for title, summary, link in unique_articles[:10]:
+    # Market data is the same for every article of a topic, so analyze it once
+    market_state = None
+    if topic in CRYPTO_SYMBOLS and unique_articles:
+        market_state = get_market_state(CRYPTO_SYMBOLS[topic])
+    
+    # Format articles
+    digest = []
+    for title, summary, link in unique_articles:
         try:
             # Analyze sentiment
             sentiment = analyze_sentiment(title + " " + summary)
-            sentiment_emoji = get_sentiment_emoji(sentiment['compound'])
+            sentiment_emoji = get_sentiment_emoji(sentiment)
             
             # Get market impact analysis if applicable
             market_impact = ""
             if topic in CRYPTO_SYMBOLS:
-                market_impact = analyze_market_impact(CRYPTO_SYMBOLS[topic], sentiment['compound'])
+                if market_state:
+                    market_impact = _format_impact(market_state, sentiment)
+                else:
+                    market_impact = "Market data unavailable"
             
             # Format message
             news_text = (
@@ -485,22 +734,54 @@ async def fetch_and_send_news_for_topic(context: ContextTypes.DEFAULT_TYPE, user
                 news_text += f"📊 Market Impact:\n{market_impact}\n\n"
             
             news_text += f"🔗 [Read full article]({link})"
-            
-            logger.info(f"Sending message to user {user_id}: {title}")
-            await context.bot.send_message(
-                chat_id=user_id,
-                text=news_text,
-                parse_mode="Markdown",
-                disable_web_page_preview=False
-            )
-            sent_articles.add(link)
-            logger.info(f"Successfully sent article: {title}")
-            
-            # Wait to avoid rate limiting
-            time.sleep(1)
-            
+            digest.append((title, link, news_text))
         except Exception as e:
-            logger.error(f"Failed to send message to {user_id}: {e}", exc_info=True)
+            logger.error(f"Failed to format article {link}: {e}", exc_info=True)
+    
+    # Don't serve a digest from a failed fetch for the full TTL
+    degraded = not all_articles or (topic in CRYPTO_SYMBOLS and market_state is None)
+    ttl = DIGEST_RETRY_TTL if degraded else DIGEST_CACHE_TTL
+    _digest_cache[topic] = (time.monotonic() + ttl, digest)
+    return digest
+
+async def _send_limited(context: ContextTypes.DEFAULT_TYPE, chat_id: int, text: str) -> None:
+    """Send a message within the per-chat and global rate limits, retrying once if throttled."""
+    chat_limiter = _chat_limiters.setdefault(chat_id, AsyncLimiter(1, 1.0))
+    for attempt in range(2):
+        async with chat_limiter, _tg_limiter:
+            try:
+                await context.bot.send_message(
+                    chat_id=chat_id,
+                    text=text,
+                    parse_mode="Markdown",
+                    disable_web_page_preview=False
+                )
+                return
+            except RetryAfter as e:
+                if attempt:
+                    raise
+                retry_after = e.retry_after
+        logger.warning(f"Rate limited sending to {chat_id}, retrying in {retry_after}s")
+        await asyncio.sleep(retry_after.total_seconds() if isinstance(retry_after, timedelta) else retry_after)
+
+async def send_digest_to_user(
+    context: ContextTypes.DEFAULT_TYPE,
+    user_id: int,
+    digests: Dict[str, List[Tuple[str, str, str]]]
+) -> None:
+    """Send the user the articles they haven't seen yet for each of their topics."""
+    for topic in user_preferences[user_id]["topics"]:
+        unseen = [item for item in digests.get(topic, []) if not _seen(user_id, item[1])]
+        
+        for title, link, news_text in unseen[:10]:
+            try:
+                logger.info(f"Sending message to user {user_id}: {title}")
+                await _send_limited(context, user_id, news_text)
+                _mark(user_id, link)
+                logger.info(f"Successfully sent article: {title}")
+                
+            except Exception as e:
+                logger.error(f"Failed to send message to {user_id}: {e}", exc_info=True)
 
 async def set_topics(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Allow users to set their preferred topics."""
@@ -590,11 +871,17 @@ async def handle_floompnews(update: Update, context: ContextTypes.DEFAULT_TYPE)
         logger.error(f"Error handling floompnews message: {e}", exc_info=True)
         await update.message.reply_text("Sorry, there was an error processing your request. Please try again later.")
 
-def run_scheduler():
-    """Run the scheduler in a separate thread."""
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+async def open_http_session(application: Application) -> None:
+    """Create the shared HTTP session once the event loop is running."""
+    global _http
+    # Pooled keep-alive connections are reused across feeds hosted on the same site
+    connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+    _http = aiohttp.ClientSession(connector=connector)
+
+async def close_http_session(application: Application) -> None:
+    """Close the shared HTTP session on shutdown."""
+    if _http is not None:
+        await _http.close()
 
 def main() -> None:
     """Start the bot."""
@@ -606,7 +893,13 @@ def main() -> None:
             raise ValueError("TELEGRAM_BOT_TOKEN not found in environment variables")
         
         logger.info("Initializing bot application...")
-        application = Application.builder().token(token).build()
+        application = (
+            Application.builder()
+            .token(token)
+            .post_init(open_http_session)
+            .post_shutdown(close_http_session)
+            .build()
+        )
         logger.info("Bot application initialized successfully")
 
         # Add command handlers
@@ -617,7 +910,7 @@ def main() -> None:
         application.add_handler(CommandHandler("help", start))
         
         # Add message handler for "floompnews"
-        application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND & filters.Regex(r'(?i)floompnews'), handle_floompnews))
+        application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND & filters.Regex(_FLOOMPNEWS_PATTERN), handle_floompnews))
         
         logger.info("Command handlers added successfully")
 
@@ -626,16 +919,10 @@ def main() -> None:
         logger.info("Setting up scheduled jobs...")
         
         # Schedule different frequency jobs
-        job_queue.run_repeating(send_daily_recap, interval=3600, first=10, name="hourly")
-        job_queue.run_daily(send_daily_recap, time=datetime_time(hour=8, minute=0), name="daily")
+        job_queue.run_repeating(send_scheduled_recaps, interval=3600, first=10, name="hourly", data="hourly")
+        job_queue.run_daily(send_scheduled_recaps, time=datetime_time(hour=8, minute=0), name="daily", data="daily")
         logger.info("Scheduled jobs set up successfully")
 
-        # Start the scheduler in a separate thread
-        scheduler_thread = threading.Thread(target=run_scheduler)
-        scheduler_thread.daemon = True
-        scheduler_thread.start()
-        logger.info("Scheduler thread started")
-
         # Run in polling mode for local testing
         logger.info("Starting bot in polling mode...")
         application.run_polling(allowed_updates=Update.ALL_TYPES, drop_pending_updates=True)